@@ -55,9 +55,11 @@ Re-running --post with the same CSV row is a safe no-op — it will log
 """
 
 import os
+import csv
 import json
 import requests
-import pandas as pd
+from datetime import datetime, timezone
+from functools import lru_cache
 from dotenv import load_dotenv
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -71,6 +73,10 @@ TOKEN   = os.getenv("FB_PAGE_TOKEN")
 
 VERSION = "v23.0"
 
+# Shared HTTP session — reuses the TLS connection to graph.facebook.com when
+# Alert.py retries or multiple predictions are posted in one run
+_SESSION = requests.Session()
+
 # Default CSV path — can be overridden via --csv flag or csv_path argument
 DEFAULT_CSV_PATH = os.path.abspath(
     os.path.join(
@@ -164,10 +170,37 @@ def build_message(tier: str, probability: float, timestamp: str) -> str:
     )
 
 
+@lru_cache(maxsize=8192)
+def _parse_timestamp(raw: str) -> datetime | None:
+    """Parse a CSV timestamp string to a UTC-aware datetime (None if invalid).
+
+    Cached — prediction CSVs repeat timestamps across re-scans, so repeat
+    calls become a dict hit instead of a fromisoformat parse.
+    """
+    raw = raw.strip()
+    # Cheap prevalidation — the scan loop calls this once per row, so bail
+    # out on obviously malformed cells without paying for a raised ValueError
+    if len(raw) < 10 or not (raw[:4].isdigit() and raw[4] == "-"):
+        return None
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    try:
+        ts = datetime.fromisoformat(raw.replace(" ", "T", 1))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
 def read_latest_from_csv(csv_path: str = None) -> dict | None:
     """
     Read the last row (by timestamp) from the predictions CSV.
 
+    Scans with csv.reader and positional indices resolved once from the
+    header — no per-row dict building and no full DataFrame just to pick
+    one row.
+
     Parameters
     ----------
     csv_path : optional path to a CSV file. Defaults to DEFAULT_CSV_PATH.
@@ -183,25 +216,46 @@ def read_latest_from_csv(csv_path: str = None) -> dict | None:
         return None
 
     try:
-        df = pd.read_csv(path)
+        # ascii decode — the predictions CSV is machine-written (timestamps,
+        # floats, tier names) and skips the utf-8 state machine
+        with open(path, "r", encoding="ascii", newline="", buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+
+            if header is None:
+                print("  ❌ CSV is empty.")
+                return None
 
-        if df.empty:
+            required_cols = ["timestamp", "flood_probability", "risk_tier"]
+            for col in required_cols:
+                if col not in header:
+                    print(f"  ❌ Missing column: {col}")
+                    return None
+
+            idx_ts   = header.index("timestamp")
+            idx_prob = header.index("flood_probability")
+            idx_tier = header.index("risk_tier")
+
+            latest_ts  = None
+            latest_row = None
+            for r in reader:
+                if not r:
+                    continue
+                ts = _parse_timestamp(r[idx_ts])
+                if ts is None:
+                    continue
+                if latest_ts is None or ts > latest_ts:
+                    latest_ts  = ts
+                    latest_row = r
+
+        if latest_row is None:
             print("  ❌ CSV is empty.")
             return None
 
-        required_cols = ["timestamp", "flood_probability", "risk_tier"]
-        for col in required_cols:
-            if col not in df.columns:
-                print(f"  ❌ Missing column: {col}")
-                return None
-
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        latest = df.sort_values("timestamp").iloc[-1]
-
         row = {
-            "tier":        str(latest["risk_tier"]).upper(),
-            "probability": float(latest["flood_probability"]),
-            "timestamp":   latest["timestamp"].strftime("%Y-%m-%d %H:%M UTC"),
+            "tier":        latest_row[idx_tier].upper(),
+            "probability": float(latest_row[idx_prob]),
+            "timestamp":   latest_ts.strftime("%Y-%m-%d %H:%M UTC"),
         }
 
         print(f"  ℹ️  Latest row — tier: {row['tier']} | prob: {row['probability']:.1%} | ts: {row['timestamp']}")
@@ -245,7 +299,7 @@ def send(tier: str, probability: float, timestamp: str, check_duplicate: bool =
     print(f"  🚀 Sending {tier} alert to Facebook Page")
 
     try:
-        res = requests.post(
+        res = _SESSION.post(
             url,
             data={
                 "message":      message,
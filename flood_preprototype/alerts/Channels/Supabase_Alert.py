@@ -45,6 +45,10 @@ DEFAULT_CSV_PATH = os.path.abspath(
 
 BATCH_SIZE = 500  # safe batch size for Supabase
 
+# Only these columns are synced — reading them positionally keeps the CSV
+# load narrow even when the predictions file grows extra columns
+SYNC_COLUMNS = ["timestamp", "flood_probability", "risk_tier"]
+
 # =========================================================
 # SYNC CSV → SUPABASE (FULL UPSERT)
 # =========================================================
@@ -65,7 +69,7 @@ def sync_predictions_to_supabase(csv_path: str = None):
             print("  ❌ CSV not found")
             return
 
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, usecols=lambda c: c in SYNC_COLUMNS)
 
         if df.empty:
             print("  ⚠️ CSV is empty")
@@ -73,20 +77,18 @@ def sync_predictions_to_supabase(csv_path: str = None):
 
         print(f"  📊 CSV rows loaded: {len(df)}")
 
-        required_cols = ["timestamp", "flood_probability", "risk_tier"]
-        for col in required_cols:
+        for col in SYNC_COLUMNS:
             if col not in df.columns:
                 raise ValueError(f"Missing column: {col}")
 
         df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
 
-        records = []
-        for _, row in df.iterrows():
-            records.append({
-                "timestamp": row["timestamp"].isoformat(),
-                "flood_probability": float(row["flood_probability"]),
-                "risk_tier": row["risk_tier"]
-            })
+        # Column-wise build + to_dict — no per-row Series allocation
+        records = pd.DataFrame({
+            "timestamp":         df["timestamp"].map(lambda ts: ts.isoformat()),
+            "flood_probability": df["flood_probability"].astype(float),
+            "risk_tier":         df["risk_tier"],
+        }).to_dict("records")
 
         print(f"  🚀 Preparing to sync {len(records)} rows")
 
@@ -125,15 +127,14 @@ def append_new_predictions_to_supabase(csv_path: str = None):
             print("  ❌ CSV not found")
             return
 
-        df = pd.read_csv(path)
+        df = pd.read_csv(path, usecols=lambda c: c in SYNC_COLUMNS)
         if df.empty:
             print("  ⚠️ CSV is empty")
             return
 
         print(f"  📊 CSV rows loaded: {len(df)}")
 
-        required_cols = ["timestamp", "flood_probability", "risk_tier"]
-        for col in required_cols:
+        for col in SYNC_COLUMNS:
             if col not in df.columns:
                 raise ValueError(f"Missing column: {col}")
 
@@ -154,13 +155,11 @@ def append_new_predictions_to_supabase(csv_path: str = None):
 
         print(f"  🚀 New rows to insert: {len(new_rows)}")
 
-        records = []
-        for _, row in new_rows.iterrows():
-            records.append({
-                "timestamp": row["timestamp_iso"],
-                "flood_probability": float(row["flood_probability"]),
-                "risk_tier": row["risk_tier"]
-            })
+        records = pd.DataFrame({
+            "timestamp":         new_rows["timestamp_iso"],
+            "flood_probability": new_rows["flood_probability"].astype(float),
+            "risk_tier":         new_rows["risk_tier"],
+        }).to_dict("records")
 
         total_inserted = 0
         for i in range(0, len(records), BATCH_SIZE):
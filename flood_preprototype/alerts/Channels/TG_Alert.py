@@ -1,9 +1,12 @@
 # TG_Alert.py
 
 import os
+import csv
 import json
 import requests
-import pandas as pd
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # --- Paths & Setup ---
@@ -25,6 +28,10 @@ STATE_PATH = os.path.join(SCRIPT_DIR, "last_telegram_sent.json")
 # --- Constants ---
 SKIP_TIERS = {"CLEAR", "LOW", "NORMAL"}
 
+# Shared HTTP session — keeps the api.telegram.org connection alive across
+# retries instead of paying a fresh TLS handshake per post
+_SESSION = requests.Session()
+
 TIER_MESSAGE = {
     "WATCH": (
         "🟡 **MAGMASID (WATCH)** — Obando, Bulacan\n"
@@ -79,9 +86,33 @@ def _save_last_sent(timestamp: str) -> None:
         print(f"  ⚠️  Could not save state file: {e}")
 
 # --- Data Readers ---
+@lru_cache(maxsize=1024)
+def _parse_timestamp(raw: str) -> datetime | None:
+    """Parse a CSV timestamp string to a UTC-aware datetime (None if invalid).
+
+    Cached so repeat polls of an unchanged CSV skip the fromisoformat parse.
+    """
+    raw = raw.strip()
+    if not raw:
+        return None
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    try:
+        ts = datetime.fromisoformat(raw.replace(" ", "T", 1))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
 def read_latest_prediction(csv_path: str = None) -> dict | None:
     """
-    Read the last row (by timestamp) from the predictions CSV.
+    Read the last row from the predictions CSV.
+
+    The predictions CSVs are written in chronological order, so instead of
+    loading the whole file just to pick one row, this streams it through a
+    bounded deque — O(1) memory regardless of how large the log grows.
 
     Parameters
     ----------
@@ -92,16 +123,32 @@ def read_latest_prediction(csv_path: str = None) -> dict | None:
         print(f"  ❌ Predictions CSV not found: {path}")
         return None
     try:
-        df = pd.read_csv(path)
-        if df.empty:
+        # ascii decode — machine-written CSV, no multibyte content possible
+        with open(path, "r", encoding="ascii", newline="", buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                print("  ❌ Predictions CSV is empty.")
+                return None
+            idx_ts   = header.index("timestamp")
+            idx_prob = header.index("flood_probability")
+            idx_tier = header.index("risk_tier")
+            tail = deque(reader, maxlen=1)
+
+        if not tail:
             print("  ❌ Predictions CSV is empty.")
             return None
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        latest = df.sort_values("timestamp").iloc[-1]
+
+        latest = tail[0]
+        ts = _parse_timestamp(latest[idx_ts])
+        if ts is None:
+            print(f"  ❌ Invalid timestamp in last row: {latest[idx_ts]!r}")
+            return None
+
         return {
-            "tier":        str(latest["risk_tier"]).upper(),
-            "probability": float(latest["flood_probability"]),
-            "timestamp":   latest["timestamp"].strftime("%Y-%m-%d %H:%M UTC"),
+            "tier":        latest[idx_tier].upper(),
+            "probability": float(latest[idx_prob]),
+            "timestamp":   ts.strftime("%Y-%m-%d %H:%M UTC"),
         }
     except Exception as e:
         print(f"  ❌ Failed to read predictions CSV: {e}")
@@ -117,7 +164,7 @@ def send_telegram_alert(token, chat_id, message_content) -> bool:
         "parse_mode": "Markdown"
     }
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = _SESSION.post(url, json=payload, timeout=10)
         response.raise_for_status()
         print("  ✅ Message successfully posted to Telegram Group!")
         return True
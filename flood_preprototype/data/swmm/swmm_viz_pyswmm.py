@@ -457,11 +457,13 @@ def main():
     if args.inp:
         inp_path = args.inp
     else:
-        matches = list(Path(".").glob("*.inp"))
-        if not matches:
+        # First .inp wins — take it straight off the glob iterator instead
+        # of materializing the whole directory listing
+        match = next(Path(".").glob("*.inp"), None)
+        if match is None:
             print("ERROR: No .inp file found.")
             sys.exit(1)
-        inp_path = str(matches[0])
+        inp_path = str(match)
         print(f"[*] Auto-detected: {inp_path}")
 
     depths, flows, rain, flooding, times = run_swmm(inp_path)
@@ -82,10 +82,12 @@ Usage
 
 import os
 import sys
+import csv
 import time
 import argparse
 import warnings
 import traceback
+from collections import deque
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -347,11 +349,26 @@ def import_comparison_modules():
 # RETRAIN NOTIFICATION
 # ===========================================================================
 
+# (path, mtime_ns, size) → last_training_date. The scheduled loop runs this
+# check every cycle; reloading the whole model pickle just to read one
+# metadata field is wasted work unless the artifact file actually changed.
+_RETRAIN_DATE_CACHE: dict = {}
+
+
+def _get_last_training_date(model_file):
+    st  = os.stat(model_file)
+    key = (str(model_file), st.st_mtime_ns, st.st_size)
+    if key not in _RETRAIN_DATE_CACHE:
+        import joblib
+        artifact = joblib.load(model_file)
+        _RETRAIN_DATE_CACHE.clear()
+        _RETRAIN_DATE_CACHE[key] = artifact.get("last_training_date")
+    return _RETRAIN_DATE_CACHE[key]
+
+
 def check_retrain_notification(XGB_Predict) -> None:
     try:
-        import joblib
-        artifact   = joblib.load(XGB_Predict.MODEL_FILE)
-        last_train = artifact.get("last_training_date")
+        last_train = _get_last_training_date(XGB_Predict.MODEL_FILE)
         if last_train is None:
             return
 
@@ -408,14 +425,19 @@ def read_latest_result(XGB_Predict) -> dict | None:
         print(f"  {C.YELLOW}WARNING{C.RESET}  Predictions CSV not found at {_link(csv_path)}")
         return None
     try:
-        df = pd.read_csv(csv_path, parse_dates=["timestamp"], index_col="timestamp")
-        if len(df) == 0:
+        # Only the newest row is needed — scan to the tail instead of parsing
+        # the whole predictions history into a DataFrame every cycle.
+        with open(csv_path, "r", encoding="ascii", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            tail   = deque(reader, maxlen=1)
+        if header is None or not tail:
             return None
-        latest = df.iloc[-1]
+        row = dict(zip(header, tail[0]))
         return {
-            "timestamp":   str(latest.name.date()),
-            "probability": float(latest.get("flood_probability", 0.0)),
-            "risk_tier":   str(latest.get("risk_tier", "CLEAR")),
+            "timestamp":   str(pd.Timestamp(row["timestamp"]).date()),
+            "probability": float(row.get("flood_probability", 0.0)),
+            "risk_tier":   str(row.get("risk_tier", "CLEAR")),
         }
     except Exception as e:
         print(f"  {C.YELLOW}WARNING{C.RESET}  Could not read predictions CSV — {e}")
@@ -426,6 +448,21 @@ def read_latest_result(XGB_Predict) -> dict | None:
 # MIDNIGHT SLEEP
 # ===========================================================================
 
+def internet_available(timeout: float = 1.0) -> bool:
+    """Cheap connectivity probe — HEAD request, no body, 1 s deadline.
+
+    Lets the network pull steps bail out in ≤1 s on an offline machine
+    instead of each blocking for its own full request timeout.
+    """
+    import requests
+    try:
+        return requests.head("https://www.google.com",
+                             timeout=timeout,
+                             allow_redirects=False).status_code < 500
+    except requests.RequestException:
+        return False
+
+
 def seconds_until_midnight() -> float:
     now      = datetime.now()
     tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
@@ -446,10 +483,15 @@ def run_daily(
 
     print_run_header(run_n)
 
+    online = True if (skip_sensor and skip_proxy) else internet_available()
+
     # ── Step 0a: Hardware sensor ingest ────────────────────────────────────
     print_phase("0a", "sensor_ingest.py", "Supabase hardware pull")
     if skip_sensor:
         print(f"  {C.GRAY}Skipped — --skip-sensor flag set.{C.RESET}")
+    elif not online:
+        print(f"  {C.YELLOW}WARNING{C.RESET}  No internet connection — skipping Supabase pull.")
+        print(f"  {C.DIM}Continuing with existing obando_sensor_data.csv.{C.RESET}")
     else:
         SensorIngest = import_sensor_ingest()
         if SensorIngest is not None:
@@ -470,6 +512,9 @@ def run_daily(
     print_phase("0b", "Sat_SensorData_proxy.py", "GEE proxy pull")
     if skip_proxy:
         print(f"  {C.GRAY}Skipped — --skip-proxy flag set.{C.RESET}")
+    elif not online:
+        print(f"  {C.YELLOW}WARNING{C.RESET}  No internet connection — skipping GEE proxy fetch.")
+        print(f"  {C.DIM}Continuing with existing obando_environmental_data.csv.{C.RESET}")
     else:
         Proxy = import_proxy_module()
         if Proxy is not None:
@@ -206,15 +206,17 @@ def get_cutoff_date(output_path: str) -> "pd.Timestamp | None":
     if not os.path.exists(output_path):
         return None
     try:
+        # Only the timestamp column is needed for the cutoff — skip
+        # materialising the sensor columns and let the OS page the file in
         existing = pd.read_csv(
             output_path,
-            parse_dates=["timestamp"],
-            index_col="timestamp",
+            usecols=["timestamp"],
+            memory_map=True,
         )
         if len(existing) == 0:
             return None
-        existing.index = pd.to_datetime(existing.index, utc=True)
-        cutoff = existing.index.max()
+        stamps = pd.to_datetime(existing["timestamp"], utc=True)
+        cutoff = stamps.max()
         print(f"  Output CSV last row : {cutoff.date()}  "
               f"({len(existing):,} rows already present)")
         return cutoff
@@ -436,27 +438,48 @@ def save_output(merged: pd.DataFrame, output_path: str,
         combined = merged[SENSOR_COLS].copy()
         print(f"  Full rebuild — overwriting output CSV.")
     elif os.path.exists(output_path):
-        # Incremental — append new rows to existing file
+        # Incremental — append only the genuinely new rows. Reading just the
+        # timestamp column is enough to dedup, so the existing file is left
+        # untouched instead of being re-read and rewritten in full each run.
         try:
-            existing = pd.read_csv(
-                output_path,
-                parse_dates=["timestamp"],
-                index_col="timestamp",
+            existing_ts = pd.to_datetime(
+                pd.read_csv(output_path, usecols=["timestamp"])["timestamp"],
+                utc=True,
             )
-            if len(existing) > 0:
+            new_rows = merged[SENSOR_COLS].dropna(subset=SENSOR_COLS, how="any")
+            dup_mask = new_rows.index.isin(existing_ts)
+
+            if dup_mask.any():
+                # Overlapping timestamps — fall back to the full rewrite so
+                # the incoming row still replaces the old one (keep="last").
+                existing = pd.read_csv(
+                    output_path,
+                    parse_dates=["timestamp"],
+                    index_col="timestamp",
+                )
                 existing.index = pd.to_datetime(existing.index, utc=True)
                 existing = existing[[c for c in SENSOR_COLS if c in existing.columns]]
                 existing = existing.dropna(subset=SENSOR_COLS, how="any")
-                combined = pd.concat([existing, merged[SENSOR_COLS]])
+                combined = pd.concat([existing, new_rows])
                 combined = (
                     combined[~combined.index.duplicated(keep="last")]
                     .sort_index()
                 )
-                print(f"  Existing rows    : {len(existing):,}")
-                print(f"  Appended rows    : {len(merged):,}")
-                print(f"  Final row count  : {len(combined):,}")
+                print(f"  Overlapping rows : {int(dup_mask.sum()):,}  (full rewrite, keep=last)")
+            elif len(new_rows) == 0:
+                print(f"  No new rows — output CSV already up to date "
+                      f"({len(existing_ts):,} rows).")
+                return
             else:
-                combined = merged[SENSOR_COLS]
+                format_index_iso(new_rows.sort_index()).to_csv(
+                    output_path, mode="a", header=False
+                )
+                print(f"  Existing rows    : {len(existing_ts):,}")
+                print(f"  Appended rows    : {len(new_rows):,}")
+                print(f"  Timestamp format : {OUTPUT_TIMESTAMP_FORMAT}  (ISO 8601)")
+                print(f"  Saved  →  {output_path}  "
+                      f"({len(existing_ts) + len(new_rows):,} rows total)")
+                return
         except Exception as e:
             print(f"  WARNING: Could not read existing CSV ({e}) — overwriting.")
             combined = merged[SENSOR_COLS]
@@ -217,6 +217,7 @@ import logging
 from datetime import date, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 # ---------------------------------------------------------------------------
@@ -391,12 +392,28 @@ def calibrate_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     out = df.copy()
 
-    out["waterlevel"] = out["waterlevel"].apply(_calibrate_waterlevel)
+    # Whole-column NumPy versions of the scalar calibrations above — one
+    # clipped linear stretch per column instead of a Python call per reading
+    dist = out["waterlevel"].to_numpy(dtype=float)
+    t    = np.clip((DIKE_HEIGHT_M - dist - HW_WL_DRY) / (HW_WL_WET - HW_WL_DRY),
+                   0.0, 1.0)
+    wl   = (PROXY_WL_DRY + t * (PROXY_WL_WET - PROXY_WL_DRY)).round(6)
+    out["waterlevel"] = np.where(
+        (dist <= DISTANCE_MIN_VALID_M) | (dist >= DISTANCE_MAX_VALID_M),
+        np.nan, wl,
+    )
     invalid = out["waterlevel"].isna().sum()
     out = out.dropna(subset=["waterlevel"])
 
-    out["soil_moisture"] = out["soil_moisture"].apply(_calibrate_soil_moisture)
-    out["humidity"]      = out["humidity"].apply(_calibrate_humidity)
+    t = np.clip((out["soil_moisture"].to_numpy(dtype=float) - SOIL_HW_DRY)
+                / (SOIL_HW_WET - SOIL_HW_DRY), 0.0, 1.0)
+    out["soil_moisture"] = (SOIL_PROXY_DRY
+                            + t * (SOIL_PROXY_WET - SOIL_PROXY_DRY)).round(6)
+
+    t = np.clip((out["humidity"].to_numpy(dtype=float) - HUMIDITY_HW_MIN)
+                / (HUMIDITY_HW_MAX - HUMIDITY_HW_MIN), 0.0, 1.0)
+    out["humidity"] = (HUMIDITY_PROXY_MIN
+                       + t * (HUMIDITY_PROXY_MAX - HUMIDITY_PROXY_MIN)).round(6)
 
     out["date"] = out["timestamp"].str[:10]
 
@@ -664,36 +681,36 @@ def insert_prediction_row(record: dict) -> bool:
 # CSV helpers
 # ---------------------------------------------------------------------------
 
+# Per-path cache of parsed timestamp sets, keyed on (mtime_ns, size) so a
+# rewrite or append invalidates it automatically. One ingest run checks the
+# same CSVs several times (latest-timestamp probe, date check, dedup) and
+# this keeps that at a single parse per file state.
+_TS_CACHE: dict[str, tuple[tuple[int, int], set[str]]] = {}
+
+
 def get_latest_csv_timestamp() -> str | None:
     """Return the latest timestamp string already in SENSOR_CSV, or None."""
-    if not SENSOR_CSV.exists():
-        return None
-    try:
-        df = pd.read_csv(SENSOR_CSV)
-        if df.empty or "timestamp" not in df.columns:
-            return None
-        return df["timestamp"].astype(str).max()
-    except Exception:
-        return None
+    stamps = _existing_timestamps(SENSOR_CSV)
+    return max(stamps) if stamps else None
 
 
 def date_already_in_csv(target_date: str) -> bool:
-    if not SENSOR_CSV.exists():
-        return False
-    try:
-        df = pd.read_csv(SENSOR_CSV)
-        return df["timestamp"].astype(str).str.startswith(target_date).any()
-    except Exception:
-        return False
+    return any(ts.startswith(target_date) for ts in _existing_timestamps(SENSOR_CSV))
 
 
 def _existing_timestamps(csv_path: Path) -> set[str]:
     """Return the set of timestamp strings already present in a CSV file."""
-    if not csv_path.exists():
-        return set()
     try:
+        # One stat serves as both the existence check and the cache key.
+        st  = csv_path.stat()
+        sig = (st.st_mtime_ns, st.st_size)
+        cached = _TS_CACHE.get(str(csv_path))
+        if cached is not None and cached[0] == sig:
+            return cached[1]
         df = pd.read_csv(csv_path, usecols=["timestamp"])
-        return set(df["timestamp"].astype(str).tolist())
+        stamps = set(df["timestamp"].astype(str).tolist())
+        _TS_CACHE[str(csv_path)] = (sig, stamps)
+        return stamps
     except Exception:
         return set()
 
@@ -129,10 +129,11 @@ def run_tier(tier: str, days: int, stride: int,
     # ── Step 4: Alert.py ──────────────────────────────────────────────
     csv_out = predict_csv_path(tier)
     if not dry_run and not csv_out.exists():
-        # XGB_Predict may use a different naming convention; glob for it
-        candidates = list(PREDICT_DIR.glob(f"*stress_{tier}*.csv"))
-        if candidates:
-            csv_out = candidates[0]
+        # XGB_Predict may use a different naming convention; glob for it.
+        # Only the first hit matters, so stop scanning as soon as one appears.
+        candidate = next(PREDICT_DIR.glob(f"*stress_{tier}*.csv"), None)
+        if candidate is not None:
+            csv_out = candidate
             print(f"  [{label}/alert] Using: {csv_out.name}")
         else:
             print(f"  [{label}/alert] ✗  Predict CSV not found in {PREDICT_DIR}")
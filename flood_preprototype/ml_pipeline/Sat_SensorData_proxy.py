@@ -62,9 +62,12 @@ Usage
 
 import gc
 import ee
-import io
 import os
 import json
+try:
+    import orjson   # optional — C-level parser, noticeably faster on big AOI files
+except ImportError:
+    orjson = None
 import argparse
 import requests
 import pandas as pd
@@ -183,9 +186,23 @@ def init_gee():
     print("✓ GEE initialized")
 
 
+# Parsed AOI keyed on the file's (mtime_ns, size) — Start.py keeps this
+# module loaded across daily runs and the GeoJSON almost never changes
+_AOI_CACHE: dict = {}
+
+
 def load_aoi() -> ee.Geometry:
-    with open(_AOI_PATH, "r") as f:
-        _geojson = json.load(f)
+    st  = os.stat(_AOI_PATH)
+    key = (st.st_mtime_ns, st.st_size)
+    if _AOI_CACHE.get("key") == key:
+        print(f"✓ AOI loaded from: {_AOI_PATH} (cached)")
+        return _AOI_CACHE["aoi"]
+    if orjson is not None:
+        with open(_AOI_PATH, "rb") as f:
+            _geojson = orjson.loads(f.read())
+    else:
+        with open(_AOI_PATH, "r") as f:
+            _geojson = json.load(f)
     if _geojson["type"] == "FeatureCollection":
         _geometry = _geojson["features"][0]["geometry"]
     elif _geojson["type"] == "Feature":
@@ -194,6 +211,8 @@ def load_aoi() -> ee.Geometry:
         _geometry = _geojson
     aoi = ee.Geometry(_geometry)
     del _geojson, _geometry
+    _AOI_CACHE["aoi"] = aoi
+    _AOI_CACHE["key"] = key
     print(f"✓ AOI loaded from: {_AOI_PATH}")
     return aoi
 
@@ -374,20 +393,20 @@ def _get_uhslc(start_date: str, end_date: str) -> pd.DataFrame:
     try:
         resp = requests.get(url, timeout=60, stream=True)
         resp.raise_for_status()
-        raw_bytes = resp.content
     except requests.RequestException as e:
         print(f"  UHSLC ERDDAP fetch failed: {e}")
         return pd.DataFrame(columns=["timestamp", "waterlevel"])
 
+    # Parse straight off the socket in 500-row blocks — the multi-year
+    # ERDDAP response never has to sit fully in memory
+    resp.raw.decode_content = True
     chunks = pd.read_csv(
-        io.BytesIO(raw_bytes),
+        resp.raw,
         skiprows=[1],
         on_bad_lines="skip",
         dtype={"sea_level": "float32"},
         chunksize=500,
     )
-    del raw_bytes
-    gc.collect()
 
     frames = []
     for chunk in chunks:
@@ -399,6 +418,8 @@ def _get_uhslc(start_date: str, end_date: str) -> pd.DataFrame:
         chunk["waterlevel"]   = (chunk["sea_level_mm"] / 1000.0).astype("float32")
         frames.append(chunk[["timestamp", "waterlevel"]])
 
+    resp.close()
+
     if not frames:
         return pd.DataFrame(columns=["timestamp", "waterlevel"])
 
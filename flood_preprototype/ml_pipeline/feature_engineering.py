@@ -220,10 +220,12 @@ def compute_waterlevel_features(
     )
 
     window_30d = t["24h"] * 30
+    # Rolling.rank is the C-implemented equivalent of ranking each window in
+    # a Python lambda — same percentile-of-last-element semantics
     df["waterlevel_pct_rank_30d"] = (
         df[col]
         .rolling(window_30d, min_periods=7)
-        .apply(lambda x: float(pd.Series(x).rank(pct=True).iloc[-1]), raw=False)
+        .rank(pct=True)
     )
 
     historical_max = df[col].expanding(min_periods=1).max()
@@ -429,29 +431,19 @@ def compute_postflood_decay_features(
     rolling_85p = df[col].rolling(window_30d, min_periods=1).quantile(WATERLEVEL_ELEVATED_PERCENTILE)
     above = (df[col] > rolling_85p).astype(int)
 
-    days_since = []
-    counter    = 0
-    for v in above:
-        if v == 1:
-            counter = 0
-        else:
-            counter += 1
-        days_since.append(counter)
-    df["days_since_flood_level"] = days_since
+    # Vectorized run-length counter: distance to the last reset position
+    # (rows above the threshold), carried forward with maximum.accumulate.
+    idx        = np.arange(len(above))
+    last_above = np.maximum.accumulate(np.where(above.to_numpy() == 1, idx, -1))
+    df["days_since_flood_level"] = idx - last_above
 
     # --- waterlevel_falling_streak ---
     tpd   = t["24h"]
     delta = df[col] - df[col].shift(tpd)       # change since previous period
 
-    falling_streak = []
-    streak = 0
-    for d in delta.fillna(0):
-        if d < 0:
-            streak += 1
-        else:
-            streak = 0
-        falling_streak.append(min(streak, 30))
-    df["waterlevel_falling_streak"] = falling_streak
+    falling   = delta.fillna(0).to_numpy() < 0
+    last_flat = np.maximum.accumulate(np.where(~falling, idx, -1))
+    df["waterlevel_falling_streak"] = np.minimum(idx - last_flat, 30)
 
     # --- post_flood_decay_7d ---
     lag_7d = df[col].shift(tpd * 7)
@@ -590,12 +582,17 @@ def compute_flood_history_features(
         return df
 
     flood_dates = labels[labels == 1].index.sort_values()
-    days_since  = []
-    for ts in df.index:
-        past = flood_dates[flood_dates < ts]
-        days_since.append(999 if len(past) == 0 else int((ts - past[-1]).days))
+    if len(flood_dates) == 0:
+        df["days_since_last_flood"] = 999
+        return df
+
+    # Most recent flood strictly before each row — one searchsorted call
+    # instead of re-filtering flood_dates per row
+    pos  = np.searchsorted(flood_dates.values, df.index.values, side="left") - 1
+    last = flood_dates.values[np.clip(pos, 0, None)]
+    days = ((df.index.values - last) / np.timedelta64(1, "D")).astype(int)
 
-    df["days_since_last_flood"] = days_since
+    df["days_since_last_flood"] = np.where(pos < 0, 999, days)
     return df
 
 
@@ -124,7 +124,20 @@ def fix_gee_timestamps(series: pd.Series) -> pd.Series:
 
 
 def parse_timestamps_robust(series: pd.Series, source_name: str) -> pd.Series:
-    series   = fix_gee_timestamps(series)
+    series = fix_gee_timestamps(series)
+
+    # Fast path first: the pipeline's own CSVs are ISO-8601, which pandas
+    # parses in C when told the format instead of guessing per element
+    try:
+        result = pd.to_datetime(series, format="ISO8601", utc=True,
+                                errors="coerce")
+        n_parsed = result.notna().sum()
+        if n_parsed == len(series):
+            print(f"  Timestamp format : ISO-8601 (all {n_parsed} parsed)")
+            return result
+    except (ValueError, TypeError):
+        pass
+
     result   = pd.to_datetime(series, utc=True, errors="coerce")
     n_parsed = result.notna().sum()
     if n_parsed == len(series):
@@ -181,7 +194,27 @@ def load_sensor(sensor_path: str = None) -> tuple:
     if not os.path.exists(path):
         sys.exit(f"\n  ERROR: Sensor file not found.\n  Expected : {path}")
 
-    df = pd.read_csv(path)
+    # Parquet sidecar cache — after the first load the binary columnar copy
+    # is read instead of re-tokenizing the whole CSV. The CSV remains the
+    # source of truth (and stays human-inspectable); a stale or missing
+    # sidecar just falls through to the text parse and is refreshed.
+    pq_path = path + ".parquet"
+    if (os.path.exists(pq_path)
+            and os.path.getmtime(pq_path) >= os.path.getmtime(path)):
+        df = pd.read_parquet(pq_path)
+        print(f"  Parquet cache : {pq_path}")
+    else:
+        # Numeric dtypes declared up front — the C parser converts these
+        # columns directly instead of inferring the dtype from a second pass
+        dtype_map = {
+            SENSOR_COLUMN_MAP.get(c, c): "float64"
+            for c in ("waterlevel", "soil_moisture", "humidity")
+        }
+        df = pd.read_csv(path, dtype=dtype_map)
+        try:
+            df.to_parquet(pq_path)
+        except Exception:
+            pass  # pyarrow unavailable or dir read-only — CSV path still works
     print(f"  Raw shape    : {df.shape[0]:,} rows x {df.shape[1]} cols")
     print(f"  Raw columns  : {list(df.columns)}")
 
@@ -262,7 +295,12 @@ def load_satellite() -> pd.DataFrame:
     if not os.path.exists(SATELLITE_FILE):
         sys.exit(f"\n  ERROR: Satellite file not found.\n  Expected : {SATELLITE_FILE}")
 
-    df = pd.read_csv(SATELLITE_FILE)
+    # Same up-front dtype declaration as load_sensor for the EO columns
+    dtype_map = {
+        SATELLITE_COLUMN_MAP.get(c, c): "float64"
+        for c in ("flood_extent", "soil_saturation", "wetness_trend")
+    }
+    df = pd.read_csv(SATELLITE_FILE, dtype=dtype_map)
     df = df.dropna(how="all")
 
     print(f"  Raw shape    : {df.shape[0]:,} rows x {df.shape[1]} cols")
@@ -67,14 +67,18 @@ Usage
 
 import gc
 import ee
-import io
 import os
 import json
+try:
+    import orjson   # optional — drop-in speedup for the AOI parse when installed
+except ImportError:
+    orjson = None
 import argparse
 import requests
 import pandas as pd
 from pathlib import Path
 from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 # ─── CONFIG ───────────────────────────────────────────────────────────────────
 
@@ -176,8 +180,12 @@ def init_gee():
 
 
 def load_aoi() -> ee.Geometry:
-    with open(_AOI_PATH, "r") as f:
-        _geojson = json.load(f)
+    if orjson is not None:
+        with open(_AOI_PATH, "rb") as f:
+            _geojson = orjson.loads(f.read())
+    else:
+        with open(_AOI_PATH, "r") as f:
+            _geojson = json.load(f)
     if _geojson["type"] == "FeatureCollection":
         _geometry = _geojson["features"][0]["geometry"]
     elif _geojson["type"] == "Feature":
@@ -367,20 +375,20 @@ def _get_uhslc(start_date: str, end_date: str) -> pd.DataFrame:
     try:
         resp = requests.get(url, timeout=60, stream=True)
         resp.raise_for_status()
-        raw_bytes = resp.content
     except requests.RequestException as e:
         print(f"  UHSLC ERDDAP fetch failed: {e}")
         return pd.DataFrame(columns=["timestamp", "waterlevel"])
 
+    # Parse straight off the socket — the response is never buffered whole
+    # in memory, so peak RAM stays at one 500-row chunk.
+    resp.raw.decode_content = True
     chunks = pd.read_csv(
-        io.BytesIO(raw_bytes),
+        resp.raw,
         skiprows=[1],
         on_bad_lines="skip",
         dtype={"sea_level": "float32"},
         chunksize=500,
     )
-    del raw_bytes
-    gc.collect()
 
     frames = []
     for chunk in chunks:
@@ -391,6 +399,8 @@ def _get_uhslc(start_date: str, end_date: str) -> pd.DataFrame:
         chunk["waterlevel"]   = (chunk["sea_level_mm"] / 1000.0).astype("float32")
         frames.append(chunk[["timestamp", "waterlevel"]])
 
+    resp.close()
+
     if not frames:
         return pd.DataFrame(columns=["timestamp", "waterlevel"])
 
@@ -625,43 +635,50 @@ def get_era5_runoff(start_date: str, end_date: str, aoi: ee.Geometry) -> pd.Data
     chunk_size = 30            # matches sentinel1_GEE.py ERA5 chunk size
     runoff_dict: dict[str, float] = {}
 
-    for offset in range(0, total_days, chunk_size):
-        chunk_dates = [
-            (start + pd.Timedelta(days=offset + d)).strftime("%Y-%m-%d")
-            for d in range(min(chunk_size, total_days - offset))
-        ]
-
-        for date_str in chunk_dates:
-            def _fetch_one_day(ds=date_str):
-                day_start = ee.Date(ds)
-                day_end   = day_start.advance(1, "day")
-                era5_day  = (
-                    ee.ImageCollection("ECMWF/ERA5_LAND/HOURLY")
-                    .filterDate(day_start, day_end)
-                    .select(["surface_runoff", "sub_surface_runoff"])
-                )
-                # Mean of hourly values, then ×1000 to convert m → mm
-                runoff_img = era5_day.mean().multiply(1000)
-
-                sro_val = runoff_img.select("surface_runoff").reduceRegion(
-                    reducer=ee.Reducer.mean(), geometry=era5_aoi,
-                    scale=9000, maxPixels=1e6, bestEffort=True,
-                ).getInfo().get("surface_runoff")
-
-                ssro_val = runoff_img.select("sub_surface_runoff").reduceRegion(
-                    reducer=ee.Reducer.mean(), geometry=era5_aoi,
-                    scale=9000, maxPixels=1e6, bestEffort=True,
-                ).getInfo().get("sub_surface_runoff")
-
-                total = 0.0
-                if sro_val  is not None: total += float(sro_val)
-                if ssro_val is not None: total += float(ssro_val)
-                return round(total, 4)
-
-            result = _safe_gee_compute(_fetch_one_day, max_retries=3)
-            runoff_dict[date_str] = result if result is not None else 0.0
-
-        print(f"  ERA5 runoff days {offset}–{min(offset + chunk_size, total_days) - 1} done")
+    def fetch_day(ds):
+        """One day's runoff total — wrapped for the worker pool below."""
+
+        def _fetch_one_day():
+            day_start = ee.Date(ds)
+            day_end   = day_start.advance(1, "day")
+            era5_day  = (
+                ee.ImageCollection("ECMWF/ERA5_LAND/HOURLY")
+                .filterDate(day_start, day_end)
+                .select(["surface_runoff", "sub_surface_runoff"])
+            )
+            # Mean of hourly values, then ×1000 to convert m → mm
+            runoff_img = era5_day.mean().multiply(1000)
+
+            sro_val = runoff_img.select("surface_runoff").reduceRegion(
+                reducer=ee.Reducer.mean(), geometry=era5_aoi,
+                scale=9000, maxPixels=1e6, bestEffort=True,
+            ).getInfo().get("surface_runoff")
+
+            ssro_val = runoff_img.select("sub_surface_runoff").reduceRegion(
+                reducer=ee.Reducer.mean(), geometry=era5_aoi,
+                scale=9000, maxPixels=1e6, bestEffort=True,
+            ).getInfo().get("sub_surface_runoff")
+
+            total = 0.0
+            if sro_val  is not None: total += float(sro_val)
+            if ssro_val is not None: total += float(ssro_val)
+            return round(total, 4)
+
+        return _safe_gee_compute(_fetch_one_day, max_retries=3)
+
+    # Each day is an independent GEE round trip, so fetch a chunk's worth
+    # concurrently — same worker count as sentinel1_GEE.py's ERA5 fetch.
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        for offset in range(0, total_days, chunk_size):
+            chunk_dates = [
+                (start + pd.Timedelta(days=offset + d)).strftime("%Y-%m-%d")
+                for d in range(min(chunk_size, total_days - offset))
+            ]
+
+            for date_str, result in zip(chunk_dates, pool.map(fetch_day, chunk_dates)):
+                runoff_dict[date_str] = result if result is not None else 0.0
+
+            print(f"  ERA5 runoff days {offset}–{min(offset + chunk_size, total_days) - 1} done")
 
     if not runoff_dict:
         print("  WARNING: No ERA5 runoff data retrieved.")
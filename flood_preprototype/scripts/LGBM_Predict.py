@@ -29,10 +29,6 @@ import warnings
 
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 from sklearn.isotonic import IsotonicRegression
 from calibrated_models import CalibratedLGBM
 
@@ -53,10 +49,12 @@ from feature_engineering import build_features, SENSOR_FEATURE_COLUMNS
 # CONFIG
 # ===========================================================================
 
-MMODEL_FILE       = os.path.join(SCRIPT_DIR, "..", "model",       "flood_lgbm_sensor.pkl")
-OUTPUT_DIR       = os.path.join(SCRIPT_DIR, "..", "predictions")
-LIVE_SENSOR_FILE = os.path.join(SCRIPT_DIR, "..", "data", "sensor", "combined_sensor_context.csv")
-FLOOD_LOG_PATH   = os.path.join(SCRIPT_DIR, "..", "data",          "flood_event_log.csv")
+PROJECT_DIR      = os.path.normpath(os.path.join(SCRIPT_DIR, ".."))   # resolved once at import
+
+MMODEL_FILE       = os.path.join(PROJECT_DIR, "model",       "flood_lgbm_sensor.pkl")
+OUTPUT_DIR       = os.path.join(PROJECT_DIR, "predictions")
+LIVE_SENSOR_FILE = os.path.join(PROJECT_DIR, "data", "sensor", "combined_sensor_context.csv")
+FLOOD_LOG_PATH   = os.path.join(PROJECT_DIR, "data",          "flood_event_log.csv")
 
 PREDICTIONS_CSV  = os.path.join(OUTPUT_DIR, "flood_lgbm_sensor_predictions.csv")
 PLOT_FILE        = os.path.join(OUTPUT_DIR, "flood_lgbm_sensor_predictions.png")
@@ -115,17 +113,16 @@ def apply_consecutive_filter(results: pd.DataFrame, warn_t: float,
     if min_days <= 1:
         return results
     results = results.copy()
-    probs   = results["flood_probability"].values
-    tiers   = results["risk_tier"].tolist()
-    streak  = 0
-    for i, p in enumerate(probs):
-        if p >= warn_t:
-            streak += 1
-        else:
-            streak = 0
-        if streak < min_days and tiers[i] in ("WARNING", "DANGER"):
-            tiers[i] = "WATCH"
-    results["risk_tier"] = tiers
+    probs = results["flood_probability"].values
+    above = probs >= warn_t
+
+    # Vectorized run length: distance since the last below-threshold row
+    idx        = np.arange(len(probs))
+    last_below = np.maximum.accumulate(np.where(~above, idx, -1))
+    streak     = np.where(above, idx - last_below, 0)
+
+    demote = (streak < min_days) & results["risk_tier"].isin(["WARNING", "DANGER"]).values
+    results.loc[demote, "risk_tier"] = "WATCH"
     return results
 
 
@@ -133,6 +130,21 @@ def apply_consecutive_filter(results: pd.DataFrame, warn_t: float,
 # 1. Load model
 # ---------------------------------------------------------------------------
 
+# Deserialized model artifact keyed on the file's (mtime_ns, size) — the
+# scheduled loop re-enters load_model() every cycle, and the pickle only
+# changes after a retrain
+_ARTIFACT_CACHE: dict = {}
+
+
+def _load_artifact(path):
+    st  = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    if _ARTIFACT_CACHE.get("key") != key:
+        _ARTIFACT_CACHE["artifact"] = joblib.load(path)
+        _ARTIFACT_CACHE["key"]      = key
+    return _ARTIFACT_CACHE["artifact"]
+
+
 def load_model() -> tuple:
     separator("Loading Model")
     if not os.path.exists(MODEL_FILE):
@@ -141,7 +153,7 @@ def load_model() -> tuple:
             f"  Expected : {MODEL_FILE}\n"
             f"  Fix      : Run LGBM_train_flood_model.py first.\n"
         )
-    artifact     = joblib.load(MODEL_FILE)
+    artifact     = _load_artifact(MODEL_FILE)
     model        = artifact["model"]
     feature_cols = artifact["feature_columns"]
     threshold    = artifact.get("threshold", DEFAULT_ALERT_THRESHOLD)
@@ -336,7 +348,7 @@ def run_predictions(model, feature_cols, features, watch_t, warn_t) -> tuple:
     if missing:
         sys.exit(f"\n  ERROR: Missing feature columns:\n    {missing}")
 
-    X        = features[feature_cols].values
+    X        = features[feature_cols].to_numpy(dtype=np.float32)  # fp32 — the boosters downcast anyway
     probs    = model.predict_proba(X)[:, 1]
     danger_t = warn_t + 0.10
 
@@ -350,15 +362,16 @@ def run_predictions(model, feature_cols, features, watch_t, warn_t) -> tuple:
     clears = (probs < watch_t).sum()
     print(f"  CLEAR rows       : {clears}")
 
-    def classify(prob):
-        if   prob >= danger_t: return "DANGER"
-        elif prob >= warn_t:   return "WARNING"
-        elif prob >= watch_t:  return "WATCH"
-        else:                  return "CLEAR"
+    # Tier assignment as one vectorized np.select instead of a per-row loop
+    risk_tiers = np.select(
+        [probs >= danger_t, probs >= warn_t, probs >= watch_t],
+        ["DANGER", "WARNING", "WATCH"],
+        default="CLEAR",
+    )
 
     results = pd.DataFrame({
         "flood_probability": probs.round(4),
-        "risk_tier":         [classify(p) for p in probs],
+        "risk_tier":         risk_tiers,
         "watch_threshold":   watch_t,
         "warning_threshold": warn_t,
         "danger_threshold":  danger_t,
@@ -389,7 +402,7 @@ def run_threshold_search(model, feature_cols, features, ground_truth) -> None:
     if len(gt) == 0:
         print(f"  SKIP — no ground truth labels.")
         return
-    X     = features.loc[gt.index][feature_cols].values
+    X     = features.loc[gt.index][feature_cols].to_numpy(dtype=np.float32)
     probs = model.predict_proba(X)[:, 1]
     prec, rec, thresholds = precision_recall_curve(gt.values, probs)
 
@@ -412,6 +425,10 @@ def print_results(results, ground_truth=None,
                   watch_t=None, warn_t=None, danger_t=None) -> None:
     separator("Prediction Results")
 
+    # Flat tier→emoji map — avoids the nested RISK_TIERS[t]["emoji"] double
+    # lookup on every printed row below
+    tier_emoji = {t: info["emoji"] for t, info in RISK_TIERS.items()}
+
     tier_counts = results["risk_tier"].value_counts()
     print("  Risk tier summary:")
     for tier, info in RISK_TIERS.items():
@@ -422,7 +439,7 @@ def print_results(results, ground_truth=None,
     print(f"\n  Latest prediction:")
     print(f"    Timestamp   : {results.index[-1].date()}")
     print(f"    Probability : {latest['flood_probability']:.1%}")
-    print(f"    Risk tier   : {RISK_TIERS[tier]['emoji']}  {tier}")
+    print(f"    Risk tier   : {tier_emoji[tier]}  {tier}")
 
     if ground_truth is not None:
         from sklearn.metrics import (precision_score, recall_score,
@@ -471,14 +488,14 @@ def print_results(results, ground_truth=None,
             gt_val = ground_truth[ts]
             gt_s   = f"  [actual={'FLOOD' if gt_val==1 else 'clear'}]"
         print(f"  {str(ts.date()):<32} {row['flood_probability']:>11.1%}  "
-              f"{RISK_TIERS[t]['emoji']} {t}{gt_s}")
+              f"{tier_emoji[t]} {t}{gt_s}")
 
     alerts = results[results["risk_tier"].isin(["WARNING", "DANGER"])]
     if len(alerts) > 0:
         print(f"\n  ⚠️  WARNING/DANGER events: {len(alerts)}")
         for ts, row in alerts.iterrows():
             t = row["risk_tier"]
-            print(f"    {RISK_TIERS[t]['emoji']}  {ts.date()}  "
+            print(f"    {tier_emoji[t]}  {ts.date()}  "
                   f"{row['flood_probability']:.1%}  {t}")
     else:
         print(f"\n  ✅  No WARNING or DANGER events in this window.")
@@ -510,6 +527,13 @@ def save_csv(results, output_csv) -> None:
 def save_plot(results, watch_t, warn_t, danger_t,
               plot_file, ground_truth=None) -> None:
     separator("Saving Plot")
+    # Deferred import — matplotlib costs several hundred ms at startup and
+    # is only needed when a plot is actually written
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     fig, ax = plt.subplots(figsize=(14, 5))
     ax.plot(results.index, results["flood_probability"],
@@ -181,6 +181,17 @@ def split_data(df, feature_cols):
            train_core, train_cal, val, test, avail
 
 
+def _nearest_thresh_row(results, target):
+    """Nearest sweep row by threshold — binary search on the sorted Thresh column."""
+    thresh = results["Thresh"].to_numpy()
+    idx    = int(np.searchsorted(thresh, target))
+    if idx >= len(thresh):
+        idx = len(thresh) - 1
+    elif idx > 0 and abs(thresh[idx - 1] - target) <= abs(thresh[idx] - target):
+        idx -= 1
+    return results.iloc[idx]
+
+
 def tune_thresholds(model, X_val, y_val, label=""):
     """
     CHANGE B — WARNING precision floor lowered to 0.55 (was 0.65).
@@ -224,7 +235,7 @@ def tune_thresholds(model, X_val, y_val, label=""):
         watch_t   = WATCH_THRESHOLD_OVERRIDE
         match     = results[results["Thresh"] == watch_t]
         watch_row = match.iloc[0] if len(match) > 0 else \
-                    results.iloc[(results["Thresh"] - watch_t).abs().argsort().iloc[0]]
+                    _nearest_thresh_row(results, watch_t)
         print(f"  WATCH : using override={watch_t:.2f} (reachable, min prob={prob_min:.3f})")
     else:
         if WATCH_THRESHOLD_OVERRIDE is not None:
@@ -252,7 +263,7 @@ def tune_thresholds(model, X_val, y_val, label=""):
         warn_t   = round(watch_t + MIN_TIER_GAP, 2)
         match    = results[results["Thresh"] == warn_t]
         warn_row = match.iloc[0] if len(match) > 0 else \
-                   results.iloc[(results["Thresh"] - warn_t).abs().argsort().iloc[0]]
+                   _nearest_thresh_row(results, warn_t)
         print(f"  ⚠️  Fallback WARNING threshold={warn_t:.2f}")
 
     # --- DANGER threshold (CHANGE G) ---
@@ -268,7 +279,7 @@ def tune_thresholds(model, X_val, y_val, label=""):
               f"(precision >= 0.70, CHANGE G)")
     else:
         danger_t   = danger_min
-        danger_row = results.iloc[(results["Thresh"] - danger_t).abs().argsort().iloc[0]]
+        danger_row = _nearest_thresh_row(results, danger_t)
         print(f"  ⚠️  No DANGER at precision >= 0.70 — fallback={danger_t:.2f}")
 
     # --- Print sweep table ---
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pandas as pd
 
 # =========================================================
@@ -35,9 +37,13 @@ base_date = extract_base_date(df, timestamp_cols)
 def normalize_timestamp(val):
     if pd.isna(val):
         return pd.NaT
+    # Timestamps repeat across the three columns — cache per unique string
+    # so repeats skip the to_datetime/tz round trip
+    return _normalize_str(str(val).strip())
 
-    val_str = str(val).strip()
 
+@lru_cache(maxsize=4096)
+def _normalize_str(val_str):
     # Handle time-only values
     if len(val_str) <= 8 and ":" in val_str:
         val_str = f"{base_date} {val_str}"
@@ -555,7 +555,7 @@ def run_swmm_simulation(
     tmp_inp = _patch_inp_dates_and_rain(inp_path, rain_mm_hr, days)
     tmp_dir = tmp_inp.parent
 
-    records: list[dict] = []
+    records: list[tuple] = []
     try:
         print(f"  [SWMM] Running {label} scenario  "
               f"(rain={rain_mm_hr} mm/hr, days={days}) ...")
@@ -570,8 +570,6 @@ def run_swmm_simulation(
             sim.step_advance(3600)
 
             for step in sim:
-                ts = pd.Timestamp(sim.current_time)
-
                 wl = float(sensor_node.depth)
                 wl = round(max(0.0, wl), 6)
 
@@ -589,13 +587,11 @@ def run_swmm_simulation(
                 )
                 hum = round(hum, 6)
 
-                records.append({
-                    "timestamp":     ts.strftime("%Y-%m-%dT%H:%M:%S"),
-                    "waterlevel":    wl,
-                    "soil_moisture": sm,
-                    "humidity":      hum,
-                    "_tier_label":   label,
-                })
+                # Plain tuples — one allocation per step instead of a
+                # five-key dict; column names are attached once below.
+                # The raw datetime is kept as-is: formatting happens once
+                # after the daily resample, not per simulation step.
+                records.append((sim.current_time, wl, sm, hum, label))
 
                 if len(records) >= days * 24:
                     break
@@ -614,9 +610,12 @@ def run_swmm_simulation(
         print("  [SWMM] No records produced — falling back to NumPy.")
         return _numpy_fallback(tier_key, days, seed)
 
-    df = pd.DataFrame(records)
+    df = pd.DataFrame(
+        records,
+        columns=["_dt", "waterlevel", "soil_moisture", "humidity", "_tier_label"],
+    )
 
-    df["_dt"] = pd.to_datetime(df["timestamp"])
+    df["_dt"] = pd.to_datetime(df["_dt"])
     df = (
         df.set_index("_dt")
           .resample("D")
@@ -668,8 +667,10 @@ def _range_check(df: pd.DataFrame, tier_key: str) -> None:
 # ---------------------------------------------------------------------------
 
 def _ramp(lo: float, hi: float, n: int,
-          noise: float = 0.02, seed: int = 0) -> np.ndarray:
-    rng  = np.random.default_rng(seed)
+          noise: float = 0.02, rng: "np.random.Generator | None" = None,
+          seed: int = 0) -> np.ndarray:
+    if rng is None:
+        rng = np.random.default_rng(seed)
     base = np.linspace(lo, hi, n)
     base += rng.normal(0, (hi - lo) * noise, n)
     return np.clip(base, lo, hi).round(6)
@@ -681,11 +682,14 @@ def _numpy_fallback(tier_key: str, days: int, seed: int = 42) -> pd.DataFrame:
     start = pd.Timestamp.utcnow().floor("D")
     dates = pd.date_range(start, periods=days, freq="D", tz="UTC")
 
-    df = pd.DataFrame({
-        "timestamp":     [d.strftime("%Y-%m-%dT%H:%M:%S") for d in dates],
-        "waterlevel":    _ramp(*p["waterlevel"],    days, seed=seed),
-        "soil_moisture": _ramp(*p["soil_moisture"], days, seed=seed + 1),
-        "humidity":      _ramp(*p["humidity"],      days, seed=seed + 2),
+    # One seeded Generator drives all three channels — column-wise batch
+    # draws, no per-channel Generator construction
+    rng = np.random.default_rng(seed)
+    df  = pd.DataFrame({
+        "timestamp":     dates.strftime("%Y-%m-%dT%H:%M:%S"),
+        "waterlevel":    _ramp(*p["waterlevel"],    days, rng=rng),
+        "soil_moisture": _ramp(*p["soil_moisture"], days, rng=rng),
+        "humidity":      _ramp(*p["humidity"],      days, rng=rng),
         "_tier_label":   label,
     })
     return df
@@ -886,21 +890,32 @@ def insert_stress_rows_to_supabase(
     else:
         base_date = pd.Timestamp(datetime.now()).normalize()
 
+    # Pull plain scalars out of the frame once — the insert loop then works
+    # on floats directly, with no Series copies and no timestamp string
+    # round-trip through _row_to_hardware.
+    src_rows = list(rows_df[["waterlevel", "soil_moisture", "humidity"]]
+                    .itertuples(index=False, name=None))
+    if "_tier_label" in rows_df.columns:
+        tiers = rows_df["_tier_label"].tolist()
+    else:
+        tiers = ["?"] * len(rows_df)
+
     for repeat in range(count):
-        for i, (_, row) in enumerate(rows_df.iterrows()):
+        for i, (wl, sm, hum) in enumerate(src_rows):
             total_offset = base_time_offset_minutes + (repeat * len(rows_df)) + i
             current_ts   = base_date + pd.Timedelta(hours=12, minutes=total_offset)
 
-            time_str = current_ts.strftime("%H:%M:%S")
-            date_str = current_ts.strftime("%Y-%m-%d")
-
-            row_with_offset = row.copy()
-            row_with_offset["timestamp"] = current_ts.strftime("%Y-%m-%dT%H:%M:%S")
-
-            record = _row_to_hardware(row_with_offset, time_str)
-            record[COL_DATE] = date_str
+            record = {
+                COL_DATE:        current_ts.strftime("%Y-%m-%d"),
+                COL_TIME:        current_ts.strftime("%H:%M:%S"),
+                COL_DISTANCE:    _reverse_waterlevel(wl),
+                COL_SOIL:        _reverse_soil_moisture(sm),
+                COL_HUMIDITY:    _reverse_humidity(hum),
+                "Temperature":   0,
+                "Pressure":      0,
+            }
 
-            tier = row.get("_tier_label", "?")
+            tier = tiers[i]
 
             print(f"  [SUPABASE] Inserting {tier} row {repeat+1}/{count} -> "
                   f"Date={record[COL_DATE]}  Time={record[COL_TIME]}  "
@@ -1169,12 +1184,13 @@ def preview(rows_df: pd.DataFrame, scenario_label: str) -> None:
     print(f"  {'─'*60}")
     print(f"  {'Timestamp':<22} {'WaterLvl':>9} {'SoilMoist':>10} {'Humidity':>9}  Tier")
     print(f"  {'─'*22} {'─'*9} {'─'*10} {'─'*9}  {'─'*8}")
-    for _, row in rows_df.iterrows():
-        tier = row.get("_tier_label", "")
-        print(
-            f"  {row['timestamp']:<22} {row['waterlevel']:>9.4f} "
-            f"{row['soil_moisture']:>10.4f} {row['humidity']:>9.4f}  {tier}"
-        )
+    tiers = rows_df.get("_tier_label", pd.Series("", index=rows_df.index))
+    for (ts, wl, sm, hum), tier in zip(
+        rows_df[["timestamp", "waterlevel", "soil_moisture", "humidity"]]
+               .itertuples(index=False, name=None),
+        tiers,
+    ):
+        print(f"  {ts:<22} {wl:>9.4f} {sm:>10.4f} {hum:>9.4f}  {tier}")
     print(f"  {'─'*60}\n")
 
 
@@ -1185,17 +1201,19 @@ def preview_hardware(rows_df: pd.DataFrame) -> None:
     print(f"  {'─'*72}")
     print(f"  {'Date':<12} {'Time':<10} {'Dist (m)':>10} {'Soil (%)':>10} {'RH (%)':>10}  Tier")
     print(f"  {'─'*12} {'─'*10} {'─'*10} {'─'*10} {'─'*10}  {'─'*8}")
-    for i, (_, row) in enumerate(rows_df.iterrows()):
+    tiers = rows_df.get("_tier_label", pd.Series("", index=rows_df.index))
+    rows  = rows_df[["timestamp", "waterlevel", "soil_moisture", "humidity"]] \
+        .itertuples(index=False, name=None)
+    for i, ((ts, wl, sm, hum), tier) in enumerate(zip(rows, tiers)):
         offset_min = i
         hour       = 12 + offset_min // 60
         minute     = offset_min % 60
         time_str   = f"{hour:02d}:{minute:02d}:00"
-        hw   = _row_to_hardware(row, time_str)
-        tier = row.get("_tier_label", "")
+        date_str   = pd.Timestamp(ts).strftime("%Y-%m-%d")
         print(
-            f"  {hw[COL_DATE]:<12} {hw[COL_TIME]:<10} "
-            f"{hw[COL_DISTANCE]:>10.4f} {hw[COL_SOIL]:>10.4f} "
-            f"{hw[COL_HUMIDITY]:>10.4f}  {tier}"
+            f"  {date_str:<12} {time_str:<10} "
+            f"{_reverse_waterlevel(wl):>10.4f} {_reverse_soil_moisture(sm):>10.4f} "
+            f"{_reverse_humidity(hum):>10.4f}  {tier}"
         )
     print(f"  {'─'*72}\n")
 
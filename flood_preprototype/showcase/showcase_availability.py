@@ -66,6 +66,7 @@ Usage
 """
 
 import os
+import csv
 import json
 import argparse
 from datetime import date, datetime, timezone
@@ -111,8 +112,17 @@ def _load_csv_dates(csv_path: str) -> set[str]:
     if not os.path.exists(csv_path):
         return set()
     try:
-        df = pd.read_csv(csv_path, usecols=["timestamp"])
-        return set(_parse_date_col(df).tolist())
+        # The timestamps are machine-written ISO strings, so the date is just
+        # the first 10 characters — a csv scan collects them without building
+        # a DataFrame only to throw it away.
+        with open(csv_path, "r", encoding="ascii", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None or "timestamp" not in header:
+                return set()
+            idx = header.index("timestamp")
+            return {row[idx][:10] for row in reader
+                    if len(row) > idx and row[idx]}
     except Exception:
         return set()
 
@@ -221,28 +231,29 @@ def compute_data_availability(start_date: date) -> list[dict]:
 # 2. Pipeline run availability
 # ---------------------------------------------------------------------------
 
-def compute_pipeline_availability() -> list[dict]:
+def compute_pipeline_availability(log_df: pd.DataFrame | None = None) -> list[dict]:
     results = []
 
-    if not os.path.exists(TRANSMISSION_LOG):
-        results.append(_build_metric(
-            metric = "Pipeline availability (runs completed)",
-            uptime = 0,
-            total  = 0,
-            notes  = "transmission_log.csv not found — run showcase_start.py first.",
-        ))
-        return results
+    if log_df is None:
+        if not os.path.exists(TRANSMISSION_LOG):
+            results.append(_build_metric(
+                metric = "Pipeline availability (runs completed)",
+                uptime = 0,
+                total  = 0,
+                notes  = "transmission_log.csv not found — run showcase_start.py first.",
+            ))
+            return results
 
-    try:
-        log_df = pd.read_csv(TRANSMISSION_LOG)
-    except Exception as e:
-        results.append(_build_metric(
-            metric = "Pipeline availability (runs completed)",
-            uptime = 0,
-            total  = 0,
-            notes  = f"Could not read transmission_log.csv: {e}",
-        ))
-        return results
+        try:
+            log_df = pd.read_csv(TRANSMISSION_LOG)
+        except Exception as e:
+            results.append(_build_metric(
+                metric = "Pipeline availability (runs completed)",
+                uptime = 0,
+                total  = 0,
+                notes  = f"Could not read transmission_log.csv: {e}",
+            ))
+            return results
 
     total = len(log_df)
 
@@ -307,17 +318,18 @@ def compute_pipeline_availability() -> list[dict]:
 # 3. Alert channel availability
 # ---------------------------------------------------------------------------
 
-def compute_alert_availability() -> list[dict]:
+def compute_alert_availability(log_df: pd.DataFrame | None = None) -> list[dict]:
     results = []
 
-    if not os.path.exists(TRANSMISSION_LOG):
-        return results
+    if log_df is None:
+        if not os.path.exists(TRANSMISSION_LOG):
+            return results
+        try:
+            log_df = pd.read_csv(TRANSMISSION_LOG)
+        except Exception:
+            return results
 
-    try:
-        log_df = pd.read_csv(TRANSMISSION_LOG)
-        total_runs = len(log_df)
-    except Exception:
-        return results
+    total_runs = len(log_df)
 
     if total_runs == 0:
         return results
@@ -376,7 +388,9 @@ def compute_alert_availability() -> list[dict]:
     predict_rows = 0
     if os.path.exists(PREDICT_CSV):
         try:
-            predict_rows = len(pd.read_csv(PREDICT_CSV))
+            # Only the row count is needed — count lines instead of parsing
+            with open(PREDICT_CSV, "r", encoding="ascii", newline="") as f:
+                predict_rows = max(sum(1 for _ in f) - 1, 0)
         except Exception:
             predict_rows = 0
 
@@ -423,10 +437,18 @@ def generate_report(start_date: date, save: bool = False) -> pd.DataFrame:
         _print_metric(m)
         all_metrics.append(m)
 
+    # Read the transmission log once — sections 2 and 3 both consume it.
+    log_df = None
+    if os.path.exists(TRANSMISSION_LOG):
+        try:
+            log_df = pd.read_csv(TRANSMISSION_LOG)
+        except Exception:
+            log_df = None
+
     # ── Section 2: Pipeline availability ──────────────────────────────────
     print(f"\n  ── 2. PIPELINE AVAILABILITY ──────────────────────────────────────")
     _print_header()
-    pipeline_metrics = compute_pipeline_availability()
+    pipeline_metrics = compute_pipeline_availability(log_df)
     if not pipeline_metrics:
         print("  No pipeline runs logged yet.")
     for m in pipeline_metrics:
@@ -436,7 +458,7 @@ def generate_report(start_date: date, save: bool = False) -> pd.DataFrame:
     # ── Section 3: Alert channel availability ─────────────────────────────
     print(f"\n  ── 3. ALERT CHANNEL AVAILABILITY ─────────────────────────────────")
     _print_header()
-    alert_metrics = compute_alert_availability()
+    alert_metrics = compute_alert_availability(log_df)
     if not alert_metrics:
         print("  No alert data available yet.")
     for m in alert_metrics:
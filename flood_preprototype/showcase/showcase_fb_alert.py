@@ -17,8 +17,9 @@ Usage
 """
 
 import os
+import csv
 import requests
-import pandas as pd
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -112,8 +113,27 @@ def build_message(tier: str, probability: float, timestamp: str) -> str:
     return template.format(prob_pct=f"{probability:.1%}", timestamp=timestamp)
 
 
+def _parse_timestamp(raw: str) -> "datetime | None":
+    """Parse a CSV timestamp string to a UTC-aware datetime (None if invalid)."""
+    raw = raw.strip()
+    if len(raw) < 10 or not (raw[:4].isdigit() and raw[4] == "-"):
+        return None
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    try:
+        ts = datetime.fromisoformat(raw.replace(" ", "T", 1))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
 def read_latest_from_csv() -> dict | None:
-    """Read the latest row from showcase_predict.csv."""
+    """Read the latest row (by timestamp) from showcase_predict.csv.
+
+    Scans with csv.reader — no DataFrame parse and sort just to pick one row.
+    """
     print(f"  📂 CSV path: {CSV_PATH}")
 
     if not os.path.exists(CSV_PATH):
@@ -121,25 +141,44 @@ def read_latest_from_csv() -> dict | None:
         return None
 
     try:
-        df = pd.read_csv(CSV_PATH)
-
-        if df.empty:
-            print("  ❌ CSV is empty.")
-            return None
+        with open(CSV_PATH, "r", encoding="ascii", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
 
-        required = ["timestamp", "flood_probability", "risk_tier"]
-        for col in required:
-            if col not in df.columns:
-                print(f"  ❌ Missing column: {col}")
+            if header is None:
+                print("  ❌ CSV is empty.")
                 return None
 
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        latest = df.sort_values("timestamp").iloc[-1]
+            required = ["timestamp", "flood_probability", "risk_tier"]
+            for col in required:
+                if col not in header:
+                    print(f"  ❌ Missing column: {col}")
+                    return None
+
+            idx_ts   = header.index("timestamp")
+            idx_prob = header.index("flood_probability")
+            idx_tier = header.index("risk_tier")
+
+            latest_ts  = None
+            latest_row = None
+            for r in reader:
+                if not r:
+                    continue
+                ts = _parse_timestamp(r[idx_ts])
+                if ts is None:
+                    continue
+                if latest_ts is None or ts > latest_ts:
+                    latest_ts  = ts
+                    latest_row = r
+
+        if latest_row is None:
+            print("  ❌ CSV is empty.")
+            return None
 
         row = {
-            "tier":        str(latest["risk_tier"]).upper(),
-            "probability": float(latest["flood_probability"]),
-            "timestamp":   latest["timestamp"].strftime("%Y-%m-%d %H:%M UTC"),
+            "tier":        latest_row[idx_tier].upper(),
+            "probability": float(latest_row[idx_prob]),
+            "timestamp":   latest_ts.strftime("%Y-%m-%d %H:%M UTC"),
         }
 
         print(f"  ℹ️  Latest row — tier: {row['tier']} | prob: {row['probability']:.1%} | ts: {row['timestamp']}")
@@ -419,6 +419,10 @@ def print_results(results, ground_truth=None,
                   watch_t=None, warn_t=None, danger_t=None) -> None:
     separator("Prediction Results")
 
+    # Flat tier→emoji map — avoids the nested RISK_TIERS[t]["emoji"] double
+    # lookup on every printed row below
+    tier_emoji = {t: info["emoji"] for t, info in RISK_TIERS.items()}
+
     tier_counts = results["risk_tier"].value_counts()
     print("  Risk tier summary:")
     for tier, info in RISK_TIERS.items():
@@ -429,7 +433,7 @@ def print_results(results, ground_truth=None,
     print(f"\n  Latest prediction:")
     print(f"    Timestamp   : {results.index[-1].date()}")
     print(f"    Probability : {latest['flood_probability']:.1%}")
-    print(f"    Risk tier   : {RISK_TIERS[tier]['emoji']}  {tier}")
+    print(f"    Risk tier   : {tier_emoji[tier]}  {tier}")
 
     print(f"\n  All predictions:")
     print(f"  {'Timestamp':<32} {'Probability':>12}  {'Risk':<10}")
@@ -437,7 +441,7 @@ def print_results(results, ground_truth=None,
     for ts, row in results.iterrows():
         t = row["risk_tier"]
         print(f"  {str(ts.date()):<32} {row['flood_probability']:>11.1%}  "
-              f"{RISK_TIERS[t]['emoji']} {t}")
+              f"{tier_emoji[t]} {t}")
 
 
 # ---------------------------------------------------------------------------
@@ -448,6 +452,21 @@ def save_csv(results, output_csv) -> None:
     separator("Saving showcase_predict.csv")
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     if os.path.exists(output_csv):
+        # Fast path: strictly-new rows append in place without re-writing
+        # the whole history.
+        existing_ts = pd.to_datetime(
+            pd.read_csv(output_csv, usecols=["timestamp"])["timestamp"]
+        )
+        no_overlap = (len(existing_ts) == 0 or
+                      (not results.index.isin(existing_ts).any()
+                       and results.index.min() > existing_ts.max()))
+        if no_overlap:
+            out = results.sort_index()
+            out.index.name = "timestamp"
+            out.to_csv(output_csv, mode="a", header=False)
+            print(f"  Saved → {output_csv}  (+{len(out):,} rows appended)")
+            return
+
         existing = pd.read_csv(output_csv, parse_dates=["timestamp"],
                                index_col="timestamp")
         combined = pd.concat([existing, results])
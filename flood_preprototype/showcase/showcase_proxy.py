@@ -16,9 +16,12 @@ Usage
 
 import gc
 import ee
-import io
 import os
 import json
+try:
+    import orjson   # optional fast path for the AOI GeoJSON parse
+except ImportError:
+    orjson = None
 import argparse
 import requests
 import pandas as pd
@@ -110,8 +113,12 @@ def init_gee():
 
 
 def load_aoi() -> ee.Geometry:
-    with open(_AOI_PATH, "r") as f:
-        _geojson = json.load(f)
+    if orjson is not None:
+        with open(_AOI_PATH, "rb") as f:
+            _geojson = orjson.loads(f.read())
+    else:
+        with open(_AOI_PATH, "r") as f:
+            _geojson = json.load(f)
     if _geojson["type"] == "FeatureCollection":
         _geometry = _geojson["features"][0]["geometry"]
     elif _geojson["type"] == "Feature":
@@ -291,20 +298,19 @@ def _get_uhslc(start_date: str, end_date: str) -> pd.DataFrame:
     try:
         resp = requests.get(url, timeout=60, stream=True)
         resp.raise_for_status()
-        raw_bytes = resp.content
     except requests.RequestException as e:
         print(f"  UHSLC ERDDAP fetch failed: {e}")
         return pd.DataFrame(columns=["timestamp", "waterlevel"])
 
+    # Parse straight off the socket — no full-response buffer in memory
+    resp.raw.decode_content = True
     chunks = pd.read_csv(
-        io.BytesIO(raw_bytes),
+        resp.raw,
         skiprows=[1],
         on_bad_lines="skip",
         dtype={"sea_level": "float32"},
         chunksize=500,
     )
-    del raw_bytes
-    gc.collect()
 
     frames = []
     for chunk in chunks:
@@ -314,6 +320,7 @@ def _get_uhslc(start_date: str, end_date: str) -> pd.DataFrame:
         chunk = chunk[chunk["sea_level_mm"] > -9000].dropna(subset=["sea_level_mm"])
         chunk["waterlevel"]   = (chunk["sea_level_mm"] / 1000.0).astype("float32")
         frames.append(chunk[["timestamp", "waterlevel"]])
+    resp.close()
 
     if not frames:
         return pd.DataFrame(columns=["timestamp", "waterlevel"])
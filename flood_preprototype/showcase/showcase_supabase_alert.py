@@ -70,13 +70,12 @@ def sync_predictions_to_supabase():
 
         df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
 
-        records = []
-        for _, row in df.iterrows():
-            records.append({
-                "timestamp":       row["timestamp"].isoformat(),
-                "flood_probability": float(row["flood_probability"]),
-                "risk_tier":       row["risk_tier"],
-            })
+        # Column-wise build + to_dict — no per-row Series allocation
+        records = pd.DataFrame({
+            "timestamp":         df["timestamp"].map(lambda ts: ts.isoformat()),
+            "flood_probability": df["flood_probability"].astype(float),
+            "risk_tier":         df["risk_tier"],
+        }).to_dict("records")
 
         print(f"  🚀 Syncing {len(records)} rows")
 
@@ -134,13 +133,11 @@ def append_new_predictions_to_supabase():
 
         print(f"  🚀 New rows to insert: {len(new_rows)}")
 
-        records = []
-        for _, row in new_rows.iterrows():
-            records.append({
-                "timestamp":       row["timestamp_iso"],
-                "flood_probability": float(row["flood_probability"]),
-                "risk_tier":       row["risk_tier"],
-            })
+        records = pd.DataFrame({
+            "timestamp":         new_rows["timestamp_iso"],
+            "flood_probability": new_rows["flood_probability"].astype(float),
+            "risk_tier":         new_rows["risk_tier"],
+        }).to_dict("records")
 
         total_inserted = 0
         for i in range(0, len(records), BATCH_SIZE):
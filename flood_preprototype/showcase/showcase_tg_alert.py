@@ -16,9 +16,10 @@ Usage
 """
 
 import os
+import csv
 import json
 import requests
-import pandas as pd
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -111,20 +112,54 @@ def _save_last_sent(timestamp: str) -> None:
 # Telegram core
 # ---------------------------------------------------------------------------
 
+def _parse_timestamp(raw: str) -> "datetime | None":
+    """Parse a CSV timestamp string to a UTC-aware datetime (None if invalid)."""
+    raw = raw.strip()
+    if len(raw) < 10 or not (raw[:4].isdigit() and raw[4] == "-"):
+        return None
+    if raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
+    try:
+        ts = datetime.fromisoformat(raw.replace(" ", "T", 1))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
 def read_latest_prediction() -> dict | None:
     if not os.path.exists(PREDICTIONS_CSV):
         print("  ❌ showcase_predict.csv not found.")
         return None
     try:
-        df = pd.read_csv(PREDICTIONS_CSV)
-        if df.empty:
+        # csv.reader scan — no DataFrame parse and sort for a single row
+        with open(PREDICTIONS_CSV, "r", encoding="ascii", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return None
+            idx_ts   = header.index("timestamp")
+            idx_prob = header.index("flood_probability")
+            idx_tier = header.index("risk_tier")
+
+            latest_ts  = None
+            latest_row = None
+            for r in reader:
+                if not r:
+                    continue
+                ts = _parse_timestamp(r[idx_ts])
+                if ts is None:
+                    continue
+                if latest_ts is None or ts > latest_ts:
+                    latest_ts  = ts
+                    latest_row = r
+        if latest_row is None:
             return None
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        latest = df.sort_values("timestamp").iloc[-1]
         return {
-            "tier":        str(latest["risk_tier"]).upper(),
-            "probability": float(latest["flood_probability"]),
-            "timestamp":   latest["timestamp"].strftime("%Y-%m-%d %H:%M UTC"),
+            "tier":        latest_row[idx_tier].upper(),
+            "probability": float(latest_row[idx_prob]),
+            "timestamp":   latest_ts.strftime("%Y-%m-%d %H:%M UTC"),
         }
     except Exception as e:
         print(f"  ❌ Failed to read showcase_predict.csv: {e}")
@@ -63,9 +63,12 @@ Usage
 """
 
 import os
+import re
+import csv
 import argparse
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 
 # ---------------------------------------------------------------------------
@@ -103,6 +106,11 @@ def _utc_now() -> str:
     return datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
 
 
+# Cheap shape check — anything that fails this can only raise inside
+# fromisoformat, and raising/catching is far slower than a regex miss.
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2})?")
+
+
 def _parse_utc(ts_str: str) -> datetime:
     """
     Parse a timestamp string to a UTC-aware datetime.
@@ -132,9 +140,13 @@ def _parse_utc(ts_str: str) -> datetime:
     # Normalize space separator
     ts_str = ts_str.replace(" ", "T", 1)
 
-    try:
-        dt = datetime.fromisoformat(ts_str)
-    except ValueError:
+    if _ISO_RE.match(ts_str):
+        try:
+            dt = datetime.fromisoformat(ts_str)
+        except ValueError:
+            dt = pd.Timestamp(ts_str).to_pydatetime()
+    else:
+        # Non-ISO shape — skip the doomed fromisoformat attempt entirely
         dt = pd.Timestamp(ts_str).to_pydatetime()
 
     if dt.tzinfo is None:
@@ -152,17 +164,43 @@ def _seconds_to_hms(seconds: float) -> str:
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
+# Process-local counters — the log file is ours once this module writes to
+# it, so the full-file scan and the exists() probe only need to happen once
+# per process, not once per logged run.
+_NEXT_RUN_ID: "int | None" = None
+_LOG_HAS_HEADER = False
+
+
 def _get_next_run_id() -> int:
-    """Return the next sequential run_id."""
+    """Return the next sequential run_id (scans the log once per process)."""
+    global _NEXT_RUN_ID
+    if _NEXT_RUN_ID is None:
+        _NEXT_RUN_ID = _scan_max_run_id() + 1
+    run_id = _NEXT_RUN_ID
+    _NEXT_RUN_ID += 1
+    return run_id
+
+
+def _scan_max_run_id() -> int:
+    """Return the highest run_id currently in the log, or 0."""
     if not os.path.exists(TRANSMISSION_LOG):
-        return 1
+        return 0
     try:
-        df = pd.read_csv(TRANSMISSION_LOG)
-        if df.empty or "run_id" not in df.columns:
-            return 1
-        return int(df["run_id"].max()) + 1
+        # ascii decode — the log is machine-written, never multibyte
+        with open(TRANSMISSION_LOG, "r", encoding="ascii", newline="",
+                  buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None or "run_id" not in header:
+                return 0
+            idx_run = header.index("run_id")
+            max_id  = 0
+            for r in reader:
+                if r and r[idx_run].isdigit():
+                    max_id = max(max_id, int(r[idx_run]))
+            return max_id
     except Exception:
-        return 1
+        return 0
 
 
 # ---------------------------------------------------------------------------
@@ -218,13 +256,21 @@ def log_run(
         "probability":        round(float(probability), 4),
     }
 
-    df_row = pd.DataFrame([record])
-
-    if not os.path.exists(TRANSMISSION_LOG):
-        df_row.to_csv(TRANSMISSION_LOG, index=False)
+    # Single buffered append — no DataFrame round-trip for a one-row write.
+    # The schema is fixed and none of the fields can contain a comma or
+    # quote, so a plain str.join beats spinning up the csv writer machinery.
+    global _LOG_HAS_HEADER
+    new_file = (not _LOG_HAS_HEADER) and not os.path.exists(TRANSMISSION_LOG)
+    with open(TRANSMISSION_LOG, "a", encoding="ascii", newline="",
+              buffering=1 << 16) as f:
+        if new_file:
+            f.write(",".join(LOG_COLUMNS) + "\n")
+        f.write(",".join(str(record[c]) for c in LOG_COLUMNS) + "\n")
+    _LOG_HAS_HEADER = True
+
+    if new_file:
         print(f"  [transmission_speed] Created transmission_log.csv — Run #{run_id}")
     else:
-        df_row.to_csv(TRANSMISSION_LOG, mode="a", header=False, index=False)
         print(f"  [transmission_speed] Logged Run #{run_id} — latency: {latency_hms} ({latency_s:.1f}s)")
 
     return record
@@ -243,8 +289,6 @@ def compute_from_csvs() -> pd.DataFrame:
 
     Returns a DataFrame summarising alignment between the two CSVs.
     """
-    results = []
-
     if not os.path.exists(SENSOR_CSV):
         print(f"  [transmission_speed] showcase_sensor.csv not found: {SENSOR_CSV}")
         return pd.DataFrame()
@@ -260,44 +304,42 @@ def compute_from_csvs() -> pd.DataFrame:
     sensor_df["date"]  = pd.to_datetime(sensor_df["timestamp"]).dt.strftime("%Y-%m-%d")
     predict_df["date"] = pd.to_datetime(predict_df["timestamp"]).dt.strftime("%Y-%m-%d")
 
-    sensor_dates  = set(sensor_df["date"].tolist())
-    predict_dates = set(predict_df["date"].tolist())
-    all_dates     = sorted(sensor_dates | predict_dates)
-
-    for d in all_dates:
-        in_sensor  = d in sensor_dates
-        in_predict = d in predict_dates
-
-        if in_sensor and in_predict:
-            pred_row = predict_df[predict_df["date"] == d].iloc[0]
-            results.append({
-                "date":         d,
-                "has_sensor":   True,
-                "has_predict":  True,
-                "tier":         pred_row.get("risk_tier", "N/A"),
-                "probability":  round(float(pred_row.get("flood_probability", 0)), 4),
-                "status":       "BOTH — same-day (wall-clock latency in transmission_log.csv)",
-            })
-        elif in_sensor and not in_predict:
-            results.append({
-                "date":        d,
-                "has_sensor":  True,
-                "has_predict": False,
-                "tier":        "N/A",
-                "probability": None,
-                "status":      "SENSOR ONLY — prediction not yet generated",
-            })
-        else:
-            results.append({
-                "date":        d,
-                "has_sensor":  False,
-                "has_predict": True,
-                "tier":        predict_df[predict_df["date"] == d].iloc[0].get("risk_tier", "N/A"),
-                "probability": None,
-                "status":      "PREDICT ONLY — no matching sensor row",
-            })
-
-    return pd.DataFrame(results)
+    if "risk_tier" not in predict_df.columns:
+        predict_df["risk_tier"] = "N/A"
+    if "flood_probability" not in predict_df.columns:
+        predict_df["flood_probability"] = 0.0
+
+    # Outer hash-join on date — replaces the per-date set lookups and the
+    # repeated predict_df boolean-mask filtering (quadratic on long logs)
+    sensor_dates = (
+        sensor_df[["date"]].drop_duplicates().assign(has_sensor=True)
+    )
+    predict_dates = (
+        predict_df.drop_duplicates("date", keep="first")
+        [["date", "risk_tier", "flood_probability"]]
+        .assign(has_predict=True)
+    )
+    aligned = sensor_dates.merge(predict_dates, on="date", how="outer", sort=True)
+    aligned["has_sensor"]  = aligned["has_sensor"].notna()
+    aligned["has_predict"] = aligned["has_predict"].notna()
+
+    both        = aligned["has_sensor"] & aligned["has_predict"]
+    sensor_only = aligned["has_sensor"] & ~aligned["has_predict"]
+
+    aligned["tier"] = aligned["risk_tier"].where(aligned["has_predict"], "N/A")
+    aligned["probability"] = pd.Series(
+        np.where(both, aligned["flood_probability"].astype(float).round(4), None),
+        index=aligned.index, dtype=object,
+    )
+    aligned["status"] = np.select(
+        [both, sensor_only],
+        ["BOTH — same-day (wall-clock latency in transmission_log.csv)",
+         "SENSOR ONLY — prediction not yet generated"],
+        default="PREDICT ONLY — no matching sensor row",
+    )
+
+    return aligned[["date", "has_sensor", "has_predict",
+                    "tier", "probability", "status"]].reset_index(drop=True)
 
 
 def print_report(last_n: int = 0) -> None:
@@ -334,7 +376,14 @@ def print_report(last_n: int = 0) -> None:
         print("  Run showcase_start.py at least once to populate it.")
     else:
         try:
-            log_df = pd.read_csv(TRANSMISSION_LOG)
+            # Explicit dtypes — the C engine converts the numeric columns
+            # directly instead of per-cell int()/float() casts in the loop
+            log_df = pd.read_csv(
+                TRANSMISSION_LOG,
+                dtype={"run_id": "int64",
+                       "latency_seconds": "float64",
+                       "probability": "float64"},
+            )
             if log_df.empty:
                 print("  No entries in transmission_log.csv yet.")
             else:
@@ -356,8 +405,8 @@ def print_report(last_n: int = 0) -> None:
                       f"{'Latency':>10}  {'Tier':<8}  {'Prob':>6}  Sensor Date")
                 print(f"  {'-'*6} {'-'*22} {'-'*22} {'-'*10}  {'-'*8}  {'-'*6}  {'-'*12}")
 
-                for _, row in log_df.iterrows():
-                    run_id      = int(row.get("run_id", 0))
+                for row in log_df.to_dict("records"):
+                    run_id      = row.get("run_id", 0)
                     ingest_ts   = str(row.get("ingest_wall_clock",  "N/A"))[:19]
                     predict_ts  = str(row.get("predict_wall_clock", "N/A"))[:19]
                     latency_hms = str(row.get("latency_hms",       "N/A"))